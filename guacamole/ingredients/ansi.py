@@ -454,14 +454,13 @@ class ANSIFormatter(object):
         If the formatter is enabled this is a pass-through to
         :func:`ansi_sgr()`. Otherwise this is a no-op that returns ``text``.
         """
+        if not self._enabled:
+            return text
         if fg == 'auto' and bg is not None:
             fg = get_visible_color(bg)
         elif bg == 'auto' and fg is not None:
             bg = get_visible_color(fg)
-        if self._enabled:
-            return ansi_sgr(text, fg, bg, style, reset, **sgr)
-        else:
-            return text
+        return ansi_sgr(text, fg, bg, style, reset, **sgr)
 
     available_colors = (
         str('black'), str('red'), str('green'), str('yellow'), str('blue'),
@@ -34,6 +34,8 @@ completion to supported shells (bash).
 from __future__ import absolute_import, print_function, unicode_literals
 
 import argparse
+import os
+import sys
 
 from guacamole.core import Ingredient
 from guacamole.recipes import RecipeError
@@ -77,6 +79,12 @@ class ParserIngredient(Ingredient):
     After parsing is done the results of parsing the command line are stored in
     the ``context.args`` attribute. This is commonly accessed by individual
     commands from their ``invoke()`` methods.
+
+    Sub-commands whose name doesn't appear on the command line cannot be
+    selected by the parser. Such sub-commands are still listed in the help
+    output but their ``register_arguments()`` method is not called and their
+    own sub-commands are not added to the parser at all. The full parser is
+    always built when shell auto-completion is requested.
     """
 
     def build_early_parser(self, context):
@@ -137,9 +145,26 @@ class ParserIngredient(Ingredient):
         parser.add_argument("-h", "--help", action="help")
         self._maybe_add_version(parser, cmd_obj)
         max_level = self._add_command_to_parser(
-            parser, cmd_name, cmd_obj, cmd_subcmds)
+            parser, cmd_name, cmd_obj, cmd_subcmds,
+            words=self._get_words(context))
         return parser, max_level
 
+    def _get_words(self, context):
+        """
+        Get the set of words that can select sub-commands.
+
+        :returns:
+            A frozenset of command line arguments or None if all of the
+            sub-commands have to be fully added to the parser.
+        """
+        if '_ARGCOMPLETE' in os.environ:
+            # argcomplete looks at the whole parser, not at argv
+            return None
+        argv = context.argv
+        if argv is None:
+            argv = sys.argv[1:]
+        return frozenset(argv)
+
     def _create_early_parser(self, context):
         early_parser = argparse.ArgumentParser(add_help=False)
         early_parser.add_argument(
@@ -172,7 +197,7 @@ class ParserIngredient(Ingredient):
         }
 
     def _add_command_to_parser(
-            self, parser, cmd_name, cmd_obj, cmd_subcmds, level=0
+            self, parser, cmd_name, cmd_obj, cmd_subcmds, level=0, words=None
     ):
         # Register this command
         cmd_obj.register_arguments(parser)
@@ -190,10 +215,14 @@ class ParserIngredient(Ingredient):
                 str(subcmd_name), help=subcmd_obj.get_cmd_help(),
                 **self._get_parser_kwargs(subcmd_obj))
             sub_parser.add_argument("-h", "--help", action="help")
+            if words is not None and str(subcmd_name) not in words:
+                # This sub-command cannot be selected, don't bother with
+                # its arguments and sub-commands.
+                continue
             max_level = max(
                 max_level, self._add_command_to_parser(
                     sub_parser, subcmd_name, subcmd_obj, subcmd_cmds,
-                    level + 1))
+                    level + 1, words))
         return max_level
 
 
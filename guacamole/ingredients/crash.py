@@ -21,7 +21,7 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-import traceback
+import sys
 
 from guacamole.core import Ingredient
 
@@ -39,6 +39,10 @@ class VerboseCrashHandler(Ingredient):
 
     def dispatch_failed(self, context):
         """Print the unhandled exception and exit the application."""
-        traceback.print_exception(
-            context.exc_type, context.exc_value, context.traceback)
+        # NOTE: traceback is imported here as it is only needed on crashes.
+        import traceback
+        # NOTE: The traceback is formatted up-front and written with a single
+        # call as print_exception() writes each line separately.
+        sys.stderr.write(str('').join(traceback.format_exception(
+            context.exc_type, context.exc_value, context.traceback)))
         raise SystemExit(1)
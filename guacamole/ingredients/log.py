@@ -22,11 +22,21 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import logging
+import sys
 
 from guacamole.core import Ingredient
+from guacamole.ingredients.ansi import ANSI
+from guacamole.ingredients.ansi import ansi_sgr
 
 _logger = logging.getLogger("guacamole")
 
+#: The stream handler shared by all logging ingredients.
+_shared_handler = None
+
+#: Names of log levels that can be passed to ``--log-level``.
+LOG_LEVEL_CHOICES = (
+    str('CRITICAL'), str('ERROR'), str('WARNING'), str('INFO'), str('DEBUG'))
+
 
 class ANSIFormatter(logging.Formatter):
 
@@ -45,13 +55,29 @@ class ANSIFormatter(logging.Formatter):
         """
         super(ANSIFormatter, self).__init__(fmt, datefmt)
         self.context = context
+        self._ansi = getattr(context, 'ansi', None)
+        self._sgr_for = self.LEVELNAME_TO_SGR.get
+        self._seq_cache = {}
+        # The SGR attributes depend on the level name alone, unless get_sgr()
+        # is overridden by a subclass. Only then can sequences be cached.
+        self._seq_per_level = type(self).get_sgr == ANSIFormatter.get_sgr
+        # The pre-computed sequences are only valid if the SGR attributes are
+        # not customized by a subclass.
+        if (self._seq_per_level and
+                self.LEVELNAME_TO_SGR is ANSIFormatter.LEVELNAME_TO_SGR):
+            self._seq_cache.update(self.LEVELNAME_TO_SEQ)
 
     def format(self, record):
         """Overridden method that applies SGR codes to log messages."""
         # XXX: idea, colorize message arguments
         s = super(ANSIFormatter, self).format(record)
-        if hasattr(self.context, 'ansi'):
-            s = self.context.ansi(s, **self.get_sgr(record))
+        ansi = self._ansi
+        if ansi is None:
+            # The ANSI ingredient may be added to the context after us.
+            ansi = self._ansi = getattr(self.context, 'ansi', None)
+        if ansi is not None and ansi.is_enabled:
+            prefix, suffix = self._get_sgr_seq(ansi, record)
+            s = prefix + s + suffix
         return s
 
     def get_sgr(self, record):
@@ -65,7 +91,28 @@ class ANSIFormatter(logging.Formatter):
             and values are suitable as keyword arguments to
             :meth:`guacamole.ingredients.ansi.ANSIFormatter.__call__()`.
         """
-        return self.LEVELNAME_TO_SGR.get(record.levelname, {})
+        return self._sgr_for(record.levelname, {})
+
+    def _get_sgr_seq(self, ansi, record):
+        """
+        Get the pair of control sequences that surround a given record.
+
+        Unless :meth:`get_sgr()` is overridden the SGR attributes depend on
+        the level name alone so the sequences are computed once per level and
+        cached. Otherwise they are computed for each record.
+        """
+        if not self._seq_per_level:
+            return (
+                ansi('', reset=False, **self.get_sgr(record)),
+                ansi.cmd('sgr_reset_all'))
+        levelname = record.levelname
+        try:
+            return self._seq_cache[levelname]
+        except KeyError:
+            seq = self._seq_cache[levelname] = (
+                ansi('', reset=False, **self.get_sgr(record)),
+                ansi.cmd('sgr_reset_all'))
+            return seq
 
     LEVELNAME_TO_SGR = {
         'DEBUG': {'dim': 1},
@@ -75,6 +122,12 @@ class ANSIFormatter(logging.Formatter):
         'CRITICAL': {'fg': 'bright_white', 'bg': 'bright_red'},
     }
 
+    #: Pre-computed pairs of control sequences for each of the levels above.
+    LEVELNAME_TO_SEQ = {
+        levelname: (ansi_sgr('', reset=False, **sgr), ANSI.cmd_sgr_reset_all)
+        for levelname, sgr in LEVELNAME_TO_SGR.items()
+    }
+
 
 class Logging(Ingredient):
 
@@ -145,8 +198,7 @@ class Logging(Ingredient):
         # Add the --log-level argument
         group.add_argument(
             "-l", "--log-level", metavar="LEVEL",
-            choices=(str('CRITICAL'), str('ERROR'), str('WARNING'),
-                     str('INFO'), str('DEBUG')),
+            choices=LOG_LEVEL_CHOICES,
             help="set global log level to the specified value")
         # Add the --trace flag
         group.add_argument(
@@ -170,11 +222,30 @@ class Logging(Ingredient):
         specific subclass is :class:`ANSIFormatter` and it adds basic ANSI
         formatting (colors and some styles) to logging messages so that they
         stand out from normal output.
+
+        A single handler is shared by all the logging ingredients. Configuring
+        logging again (for the same or for another context) just re-targets
+        that handler so that each record is only ever written once.
+
+        .. note::
+            The handler formats records using the context that configured
+            logging last. An earlier context that is still running (e.g. an
+            application that runs another guacamole command in the same
+            process) loses its own formatting at that point.
         """
-        fmt = "%(name)-12s: %(levelname)-8s %(message)s"
-        formatter = ANSIFormatter(context, fmt)
-        handler = logging.StreamHandler()
-        handler.setFormatter(formatter)
+        global _shared_handler
+        if _shared_handler is None:
+            _shared_handler = logging.StreamHandler()
+        handler = _shared_handler
+        if handler.stream is not sys.stderr:
+            # Follow sys.stderr, as a freshly created handler would.
+            handler.flush()
+            handler.stream = sys.stderr
+        formatter = handler.formatter
+        if not (isinstance(formatter, ANSIFormatter) and
+                formatter.context is context):
+            fmt = "%(name)-12s: %(levelname)-8s %(message)s"
+            handler.setFormatter(ANSIFormatter(context, fmt))
         logging.root.addHandler(handler)
 
     def adjust_logging(self, context):
@@ -191,6 +262,8 @@ class Logging(Ingredient):
         if context.early_args.log_level:
             log_level = context.early_args.log_level
             logging.getLogger("").setLevel(log_level)
-        for name in context.early_args.trace:
+        trace = context.early_args.trace
+        for name in trace:
             logging.getLogger(name).setLevel(logging.DEBUG)
-            _logger.info("Enabled tracing on logger %r", name)
+        if trace:
+            _logger.info("Enabled tracing on loggers: %r", trace)
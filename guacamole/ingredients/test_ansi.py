@@ -52,3 +52,10 @@ class ANSIFormatterTests(unittest.TestCase):
                 mock.call("goodbye world"),
                 mock.call("\n"),
             ])
+
+    def test_instance_patching_works(self):
+        """check that methods can be patched on an instance."""
+        fmt = ANSIFormatter(enabled=False)
+        with mock.patch.object(fmt, 'aprint') as mocked_aprint:
+            fmt.aprint("hello world")
+        mocked_aprint.assert_called_once_with("hello world")
@@ -23,8 +23,15 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import contextlib
 import io
+import os
 import sys
-import unittest
+
+if sys.version_info[:2] <= (3, 3):
+    import unittest2 as unittest
+    import mock
+else:
+    import unittest
+    from unittest import mock
 
 from guacamole.core import Bowl
 from guacamole.ingredients.argparse import ParserIngredient
@@ -44,13 +51,20 @@ class ParserIngredientTests(unittest.TestCase):
 
     """Tests for the ParserIngredient class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Common initialization method shared by all tests."""
+        # The commands are stateless so the tree can be shared by all tests.
+        cls.cmd_tree = cmd_tree_node(
+            None, _cmd(), (cmd_tree_node('sub', _sub(), ()),))
+
     def setUp(self):
         """Common initialization method."""
+        # NOTE: Each bowl is single-use so it cannot be shared.
         self.bowl = Bowl([ParserIngredient()])
         # The next two lines implement a correctly-behaving cmdtree ingredient
-        self.bowl.context.cmd_tree = cmd_tree_node(
-            None, _cmd(), (cmd_tree_node('sub', _sub(), ()),))
-        self.bowl.context.cmd_toplevel = self.bowl.context.cmd_tree.cmd_obj
+        self.bowl.context.cmd_tree = self.cmd_tree
+        self.bowl.context.cmd_toplevel = self.cmd_tree.cmd_obj
 
     def test_regression_4(self):
         """
@@ -70,6 +84,22 @@ class ParserIngredientTests(unittest.TestCase):
         self.bowl.eat(['sub'])
         self.assertEqual(self.bowl.context.args.sub_command, 'sub')
 
+    def test_unselected_sub_commands_are_not_built(self):
+        """Arguments of sub-commands absent from argv are not registered."""
+        sub_obj = self.cmd_tree.children[0].cmd_obj
+        with mock.patch.object(sub_obj, 'register_arguments') as ra:
+            with self.assertRaises(SystemExit):
+                with discard_stderr():
+                    self.bowl.eat([])
+        ra.assert_not_called()
+
+    def test_selected_sub_commands_are_built(self):
+        """Arguments of sub-commands present in argv are registered."""
+        sub_obj = self.cmd_tree.children[0].cmd_obj
+        with mock.patch.object(sub_obj, 'register_arguments') as ra:
+            self.bowl.eat(['sub'])
+        ra.assert_called_once_with(mock.ANY)
+
 
 @contextlib.contextmanager
 def redirect_stderr(new_target):
@@ -96,16 +126,13 @@ def discard_stderr():
     """
     Context manager for discarding sys.stderr.
 
-    This method simply opens ``/dev/null`` (posix) or ``NUL`` (windows) and
-    uses :func:`redirect_stderr()` to send all stderr data there.
+    This method simply opens :data:`os.devnull` (``/dev/null`` on posix,
+    ``NUL`` on windows) and uses :func:`redirect_stderr()` to send all stderr
+    data there.
 
     This context manager infuences python code only, native system-level stderr
     is not affected.
     """
-    if sys.platform == 'win32':
-        devnul = 'NUL'
-    else:
-        devnul = '/dev/null'
-    with open(devnul, 'wt') as stream:
+    with open(os.devnull, 'wt') as stream:
         with redirect_stderr(stream):
             yield
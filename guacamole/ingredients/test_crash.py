@@ -0,0 +1,61 @@
+# encoding: utf-8
+# This file is part of Guacamole.
+#
+# Copyright 2012-2015 Canonical Ltd.
+# Written by:
+#   Zygmunt Krynicki <zygmunt.krynicki@canonical.com>
+#
+# Guacamole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3,
+# as published by the Free Software Foundation.
+#
+# Guacamole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Guacamole.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the crash module."""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import sys
+
+# Pick the right testing tools
+if sys.version_info[0:2] >= (3, 4):
+    import unittest
+    from unittest import mock
+else:
+    import unittest2 as unittest
+    import mock
+
+from guacamole.core import Context
+from guacamole.ingredients.crash import VerboseCrashHandler
+
+
+class VerboseCrashHandlerTests(unittest.TestCase):
+
+    """Tests for the VerboseCrashHandler class."""
+
+    def test_dispatch_failed__non_ascii(self):
+        """Calling dispatch_failed() copes with non-ASCII exceptions."""
+        message = 'caf\xe9'
+        if sys.version_info[0] == 2:
+            # Python 2 formats tracebacks as byte strings.
+            message = message.encode('utf-8')
+        context = Context()
+        try:
+            raise ValueError(message)
+        except ValueError:
+            context.exc_type, context.exc_value, context.traceback = (
+                sys.exc_info())
+        with mock.patch('sys.stderr') as stderr:
+            with self.assertRaises(SystemExit) as boom:
+                VerboseCrashHandler().dispatch_failed(context)
+        self.assertEqual(boom.exception.args, (1,))
+        self.assertEqual(stderr.write.call_count, 1)
+        text = stderr.write.call_args[0][0]
+        self.assertTrue(text.startswith(str('Traceback')))
+        self.assertIn(str('ValueError: ') + str(message), text)
@@ -22,6 +22,7 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import argparse
+import logging
 import sys
 
 # Pick the right testing tools
@@ -34,9 +35,56 @@ else:
 
 from guacamole.core import Bowl
 from guacamole.core import Context
+from guacamole.ingredients import ansi
 from guacamole.ingredients import log
 
 
+class ANSIFormatterTests(unittest.TestCase):
+
+    """Tests for the ANSIFormatter class."""
+
+    def setUp(self):
+        """Common setup code."""
+        self.context = Context()
+        self.formatter = log.ANSIFormatter(self.context, "%(message)s")
+
+    def _make_record(self, level):
+        return logging.LogRecord(
+            'name', level, 'path', 1, 'message', None, None)
+
+    def test_format__enabled(self):
+        """Calling ANSIFormatter.format() applies per-level SGR codes."""
+        self.context.ansi = ansi.ANSIFormatter(enabled=True)
+        for level in (logging.DEBUG, logging.INFO, logging.WARNING,
+                      logging.ERROR, logging.CRITICAL, 5):
+            record = self._make_record(level)
+            self.assertEqual(
+                self.formatter.format(record),
+                self.context.ansi(
+                    'message', **self.formatter.get_sgr(record)))
+
+    def test_format__custom_get_sgr(self):
+        """Calling ANSIFormatter.format() uses get_sgr() of subclasses."""
+        class formatter_cls(log.ANSIFormatter):
+            def get_sgr(self, record):
+                return {'fg': 'red' if record.name == 'a' else 'green'}
+
+        self.context.ansi = ansi.ANSIFormatter(enabled=True)
+        formatter = formatter_cls(self.context, "%(message)s")
+        for name, fg in (('a', 'red'), ('b', 'green')):
+            record = logging.LogRecord(
+                name, logging.INFO, 'path', 1, 'message', None, None)
+            self.assertEqual(
+                formatter.format(record),
+                self.context.ansi('message', fg=fg))
+
+    def test_format__disabled(self):
+        """Calling ANSIFormatter.format() doesn't add any SGR codes."""
+        self.context.ansi = ansi.ANSIFormatter(enabled=False)
+        record = self._make_record(logging.ERROR)
+        self.assertEqual(self.formatter.format(record), 'message')
+
+
 class LoggingTests(unittest.TestCase):
 
     """Tests for the Logging ingredient."""
@@ -91,6 +139,20 @@ class LoggingTests(unittest.TestCase):
             self.ingredient.early_init(self.context)
         al.assert_not_called()
 
+    def test_adjust_logging(self):
+        """Calling Logging.adjust_logging() enables tracing on loggers."""
+        self.context.early_args.log_level = None
+        self.context.early_args.trace = ['foo', 'bar']
+        with mock.patch('logging.getLogger') as getLogger:
+            with mock.patch.object(log, '_logger') as _logger:
+                self.ingredient.adjust_logging(self.context)
+        getLogger.assert_has_calls([
+            mock.call('foo'), mock.call().setLevel(logging.DEBUG),
+            mock.call('bar'), mock.call().setLevel(logging.DEBUG),
+        ])
+        _logger.info.assert_called_once_with(
+            "Enabled tracing on loggers: %r", ['foo', 'bar'])
+
     def test_build_parser__enabled(self):
         """Calling Logging.build_parser() adds the new option."""
         self.ingredient._expose_argparse = True
@@ -103,6 +165,30 @@ class LoggingTests(unittest.TestCase):
         self.ingredient.build_parser(self.context)
         self._test_logging_option_was_not_added(self.context.parser)
 
+    def test_configure_logging__adds_handler_once(self):
+        """Calling Logging.configure_logging() twice adds one handler."""
+        handlers = logging.root.handlers[:]
+        self.addCleanup(setattr, logging.root, 'handlers', handlers)
+        self.ingredient.configure_logging(self.context)
+        self.ingredient.configure_logging(self.context)
+        log.Logging().configure_logging(self.context)
+        new_handlers = [
+            handler for handler in logging.root.handlers
+            if handler not in handlers]
+        self.assertEqual(new_handlers, [log._shared_handler])
+
+    def test_configure_logging__shares_handler(self):
+        """Calling Logging.configure_logging() for two contexts shares one."""
+        handlers = logging.root.handlers[:]
+        self.addCleanup(setattr, logging.root, 'handlers', handlers)
+        other_context = Context()
+        self.ingredient.configure_logging(self.context)
+        handler = log._shared_handler
+        log.Logging().configure_logging(other_context)
+        self.assertIs(log._shared_handler, handler)
+        self.assertEqual(logging.root.handlers.count(handler), 1)
+        self.assertIs(handler.formatter.context, other_context)
+
     def _test_logging_option_was_added(self, parser):
         parser.add_argument_group.assert_called_with(
             "Logging and debugging")
@@ -114,21 +114,27 @@ class Recipe(object):
         again). If SystemExit is raised but `exit` is False the argument to
         SystemExit is unwrapped and returned instead.
         """
-        bowl = self.prepare()
+        if exit:
+            return self._main_exit(argv)
+        else:
+            return self._main_noexit(argv)
+
+    def _main_exit(self, argv):
+        """Implementation of :meth:`main()` that always raises SystemExit."""
+        retval = self.prepare().eat(argv)
+        if retval is None:
+            retval = 0
+        raise SystemExit(retval)
+
+    def _main_noexit(self, argv):
+        """Implementation of :meth:`main()` that never raises SystemExit."""
         try:
-            retval = bowl.eat(argv)
+            retval = self.prepare().eat(argv)
         except SystemExit as exc:
-            if exit:
-                raise
-            else:
-                return exc.args[0]
-        else:
-            if retval is None:
-                retval = 0
-            if exit:
-                raise SystemExit(retval)
-            else:
-                return retval
+            return exc.args[0]
+        if retval is None:
+            retval = 0
+        return retval
 
 
 class RecipeError(Exception):
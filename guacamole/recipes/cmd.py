@@ -31,15 +31,9 @@ and for creating hierarhical command groups. They are captured by the
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-import gettext
-import inspect
 import logging
+import sys
 
-from guacamole.ingredients import ansi
-from guacamole.ingredients import argparse
-from guacamole.ingredients import cmdtree
-from guacamole.ingredients import crash
-from guacamole.ingredients import log
 from guacamole.recipes import Recipe
 
 
@@ -51,6 +45,9 @@ __all__ = (
 
 _logger = logging.getLogger('guacamole')
 
+#: Spices of commands that don't define any.
+_EMPTY_SPICES = frozenset()
+
 
 class Command(object):
 
@@ -114,10 +111,7 @@ class Command(object):
             Application vendor name is looked up using the ``app_vendor``
             attribute.
         """
-        try:
-            return self.app_vendor
-        except AttributeError:
-            pass
+        return getattr(self, 'app_vendor', None)
 
     def get_app_name(self):
         """
@@ -130,10 +124,7 @@ class Command(object):
         called ``my-app`` or ``myapp`` while the application might be called
         ``My Application``.
         """
-        try:
-            return self.app_name
-        except AttributeError:
-            pass
+        return getattr(self, 'app_name', None)
 
     def get_app_id(self):
         """
@@ -158,10 +149,7 @@ class Command(object):
             are disabled. It is strongly recommended to implement this method
             and return a correct value as it enhances application behavior.
         """
-        try:
-            return self.app_id
-        except AttributeError:
-            pass
+        return getattr(self, 'app_id', None)
 
     def get_cmd_name(self):
         """
@@ -171,10 +159,7 @@ class Command(object):
             If this method returns None then the executable name is guessed
             from ``sys.argv[0]``.
         """
-        try:
-            return self.name
-        except AttributeError:
-            pass
+        return getattr(self, 'name', None)
 
     def get_cmd_version(self):
         """
@@ -184,10 +169,7 @@ class Command(object):
             If this method returns None then the ``--version`` option
             is disabled.
         """
-        try:
-            return self.version
-        except AttributeError:
-            pass
+        return getattr(self, 'version', None)
 
     def get_cmd_usage(self):
         """
@@ -208,10 +190,7 @@ class Command(object):
         complicated syntax and you want to provide an alternative, more terse
         usage string instead.
         """
-        try:
-            return self.usage
-        except AttributeError:
-            pass
+        return getattr(self, 'usage', None)
 
     def get_cmd_help(self):
         """
@@ -228,13 +207,7 @@ class Command(object):
         try:
             return self.help
         except AttributeError:
-            pass
-        try:
-            return get_localized_docstring(
-                self, self.get_gettext_domain()
-            ).splitlines()[0].rstrip('.').lower()
-        except (AttributeError, IndexError, ValueError):
-            pass
+            return self._parse_cmd_doc()[0]
 
     def get_cmd_description(self):
         """
@@ -261,15 +234,7 @@ class Command(object):
         try:
             return self.description
         except AttributeError:
-            pass
-        try:
-            return '\n'.join(
-                get_localized_docstring(
-                    self, self.get_gettext_domain()
-                ).splitlines()[1:]
-            ).split('@EPILOG@', 1)[0].strip()
-        except (AttributeError, IndexError, ValueError):
-            pass
+            return self._parse_cmd_doc()[1]
 
     def get_cmd_epilog(self):
         """
@@ -292,17 +257,36 @@ class Command(object):
         means of finding additional documentation.
         """
         try:
-            return self.source.epilog
+            return self.epilog
         except AttributeError:
-            pass
+            return self._parse_cmd_doc()[2]
+
+    def _parse_cmd_doc(self):
+        """
+        Split the localized docstring of this command into parts.
+
+        :returns:
+            A tuple (help, description, epilog) with the values used by
+            :meth:`get_cmd_help()`, :meth:`get_cmd_description()` and
+            :meth:`get_cmd_epilog()`. Each part is None if it is not present.
+
+        The docstring is split once and the result is cached on the command.
+        """
         try:
-            return '\n'.join(
-                get_localized_docstring(
-                    self, self.get_gettext_domain()
-                ).splitlines()[1:]
-            ).split('@EPILOG@', 1)[1].strip()
-        except (AttributeError, IndexError, ValueError):
+            return self._cmd_doc_cache
+        except AttributeError:
             pass
+        doc = get_localized_docstring(self, self.get_gettext_domain())
+        if doc is None:
+            parts = (None, None, None)
+        else:
+            first, _, rest = doc.partition('\n')
+            cmd_help = first.rstrip('.').lower() if doc else None
+            description, sep, epilog = rest.partition('@EPILOG@')
+            parts = (
+                cmd_help, description.strip(), epilog.strip() if sep else None)
+        self._cmd_doc_cache = parts
+        return parts
 
     def get_gettext_domain(self):
         """
@@ -314,10 +298,7 @@ class Command(object):
         .. note::
             If this method returns None then all i18n services are disabled.
         """
-        try:
-            return self.gettext_domain
-        except AttributeError:
-            pass
+        return getattr(self, 'gettext_domain', None)
 
     def get_locale_dir(self):
         """
@@ -331,10 +312,7 @@ class Command(object):
             are used (on compatibles systems). In practical terms, on Windows,
             you may need to use it to have access to localization data.
         """
-        try:
-            return self.locale_dir
-        except AttributeError:
-            pass
+        return getattr(self, 'locale_dir', None)
 
     def get_sub_commands(self):
         """
@@ -354,10 +332,7 @@ class Command(object):
         commands, for example ``git commit`` is a sub-command of the ``git``
         command. All commands can be nested this way.
         """
-        try:
-            return self.sub_commands
-        except AttributeError:
-            return ()
+        return getattr(self, 'sub_commands', ())
 
     def get_cmd_spices(self):
         """
@@ -372,32 +347,60 @@ class Command(object):
             string represents as single flag. Ingredients should document the
             set of flags they understand and use.
         :returns:
-            An empty set otherwise
+            An empty frozenset otherwise
 
         Some flags have a generic meaning, you can scope a flag to a given
         ingredient using the ``name:`` prefix where the name is the name of the
         ingredient.
         """
-        try:
-            spices = self.spices
-        except AttributeError:
-            spices = set()
-        return spices
+        return getattr(self, 'spices', _EMPTY_SPICES)
 
     def main(self, argv=None, exit=True):
         """
         Shortcut for running a command.
 
         See :meth:`guacamole.recipes.Recipe.main()` for details.
-        """
+
+        .. note::
+            When the only argument is ``--version`` the version is printed
+            right away, without preparing any of the ingredients. This is
+            only done on Python 3.4 and newer, where argparse prints the
+            version to stdout as well.
+        """
+        if (sys.version_info[:2] >= (3, 4) and
+                list(sys.argv[1:] if argv is None else argv) ==
+                ['--version']):
+            version = self.get_cmd_version()
+            # NOTE: argparse expands %(prog)s in the version string, leave
+            # such versions to the parser.
+            if version is not None and '%' not in version:
+                # Format the version exactly as argparse's version action
+                # does. Without %(prog)s in the text prog is never used.
+                import argparse
+                formatter = argparse.HelpFormatter(prog=None)
+                formatter.add_text(version)
+                sys.stdout.write(formatter.format_help())
+                if exit:
+                    raise SystemExit(0)
+                return 0
         return CommandRecipe(self).main(argv, exit)
 
 
 def get_localized_docstring(obj, domain):
-    """Get a cleaned-up, localized copy of docstring of this class."""
-    if obj.__class__.__doc__ is not None:
-        return inspect.cleandoc(
-            gettext.dgettext(domain, obj.__class__.__doc__))
+    """
+    Get a cleaned-up, localized copy of docstring of this class.
+
+    The translation depends on the text domain bindings and on the locale
+    environment at the time of the call so the result is not cached here.
+    Commands keep the parsed result for the duration of one run.
+    """
+    doc = obj.__class__.__doc__
+    if doc is None:
+        return None
+    # NOTE: Those modules are only needed when help is being displayed.
+    import gettext
+    import inspect
+    return inspect.cleandoc(gettext.dgettext(domain, doc))
 
 
 class CommandRecipe(Recipe):
@@ -410,6 +413,13 @@ class CommandRecipe(Recipe):
 
     def get_ingredients(self):
         """Get a list of ingredients for guacamole."""
+        # NOTE: Ingredients are imported here so that merely importing a
+        # command (e.g. for introspection) doesn't load all of them.
+        from guacamole.ingredients import ansi
+        from guacamole.ingredients import argparse
+        from guacamole.ingredients import cmdtree
+        from guacamole.ingredients import crash
+        from guacamole.ingredients import log
         return [
             cmdtree.CommandTreeBuilder(self.command),
             cmdtree.CommandTreeDispatcher(),
@@ -0,0 +1,124 @@
+# encoding: utf-8
+# This file is part of Guacamole.
+#
+# Copyright 2012-2015 Canonical Ltd.
+# Written by:
+#   Zygmunt Krynicki <zygmunt.krynicki@canonical.com>
+#
+# Guacamole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3,
+# as published by the Free Software Foundation.
+#
+# Guacamole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Guacamole.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the cmd module."""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import io
+import sys
+
+if sys.version_info[:2] <= (3, 3):
+    import unittest2 as unittest
+    import mock
+else:
+    import unittest
+    from unittest import mock
+
+from guacamole.recipes.cmd import Command
+from guacamole.recipes.cmd import CommandRecipe
+
+
+class _cmd(Command):
+    version = '1.0'
+
+
+class CommandTests(unittest.TestCase):
+
+    """Tests for the Command class."""
+
+    @unittest.skipIf(sys.version_info[:2] < (3, 4), "argparse uses stderr")
+    def test_main__version(self):
+        """Command.main() prints the version without preparing a recipe."""
+        with mock.patch('guacamole.recipes.cmd.CommandRecipe') as recipe:
+            with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+                retval = _cmd().main(['--version'], exit=False)
+        self.assertEqual(retval, 0)
+        self.assertEqual(stdout.getvalue(), '1.0\n')
+        recipe.assert_not_called()
+
+    def test_main__version_matches_parser(self):
+        """Command.main() prints the version just like the parser does."""
+        class cmd(Command):
+            version = '  cmd   1.0\n(build  7) ' + 'x' * 200
+
+        outputs = []
+        for main in (cmd().main, CommandRecipe(cmd()).main):
+            with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+                with mock.patch('sys.stderr', new_callable=io.StringIO) as \
+                        stderr:
+                    retval = main(['--version'], exit=False)
+            outputs.append((retval, stdout.getvalue(), stderr.getvalue()))
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_docstring_parts(self):
+        """help, description and epilog are taken from the docstring."""
+        class cmd(Command):
+
+            """
+            Do the thing.
+
+            The description.
+
+            @EPILOG@
+
+            The epilog.
+            """
+
+        obj = cmd()
+        self.assertEqual(obj.get_cmd_help(), 'do the thing')
+        self.assertEqual(obj.get_cmd_description(), 'The description.')
+        self.assertEqual(obj.get_cmd_epilog(), 'The epilog.')
+
+    def test_explicit_epilog(self):
+        """An explicit epilog attribute takes precedence over the docstring."""
+        class cmd(Command):
+
+            """
+            Do the thing.
+
+            @EPILOG@
+
+            Docstring epilog.
+            """
+
+            epilog = 'Explicit epilog.'
+
+        self.assertEqual(cmd().get_cmd_epilog(), 'Explicit epilog.')
+
+
+class GetLocalizedDocstringTests(unittest.TestCase):
+
+    """Tests for the get_localized_docstring() function."""
+
+    def test_translation_changes(self):
+        """get_localized_docstring() follows changes of the translation."""
+        class cmd(Command):
+
+            """Greet people."""
+
+            gettext_domain = 'app'
+
+        self.assertEqual(cmd().get_cmd_help(), 'greet people')
+        # Binding the domain or changing the locale changes what dgettext()
+        # returns, new command instances see the new translation.
+        with mock.patch('gettext.dgettext', return_value='Leute grüßen.') \
+                as dgettext:
+            self.assertEqual(cmd().get_cmd_help(), 'leute grüßen')
+        dgettext.assert_called_once_with('app', 'Greet people.')
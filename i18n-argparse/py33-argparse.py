@@ -44,12 +44,11 @@ _('cannot have multiple subparser arguments')
 _('unrecognized arguments: %s')
 _('not allowed with argument %s')
 _('ignored explicit argument %r')
-_('ignored explicit argument %r')
 _('the following arguments are required: %s')
 _('one of the arguments %s is required')
 _('expected one argument')
 _('expected at most one argument')
-_('expected at least one argument'),
+_('expected at least one argument')
 ngettext('expected %s argument',
          'expected %s arguments', 0)
 _('ambiguous option: %(option)s could match %(matches)s')
@@ -27,8 +27,10 @@ except ImportError:
     from distutils.core import setup
 
 
-readme = open('README.rst').read()
-history = open('HISTORY.rst').read().replace('.. :changelog:', '')
+with open('README.rst', 'rb') as stream:
+    readme = stream.read().decode('utf-8')
+with open('HISTORY.rst', 'rb') as stream:
+    history = stream.read().decode('utf-8').replace('.. :changelog:', '')
 
 
 setup(